@@ -1,5 +1,6 @@
 from enum import IntFlag, IntEnum
 import struct
+from collections import namedtuple
 
 from binary import BinaryBase, Item, EnumTransformer, MSBZeroBytes
 
@@ -46,6 +47,9 @@ class ID3v2FrameHeader(BinaryBase):
     data_size = Item('>I')
     flags = Item('>H', EnumTransformer(ID3v2FrameHeaderFlag))
 
+# same layout as ID3v2FrameHeader, for scanning frames w/o building header objects
+_frame_header_struct = struct.Struct('>4sIH')
+
 
 class ID3v2FrameBase:
     def __init__(self, buf):
@@ -102,13 +106,22 @@ def FrameForIdentifier(identifier):
     else:
         return ID3v2FrameBase
 
+ID3v2FrameEntry = namedtuple('ID3v2FrameEntry', 'frame_id offset size flags')
+
+
+def encode_frame_id(frame_id):
+    if isinstance(frame_id, str):
+        return frame_id.encode('latin-1')
+    return frame_id
+
+
 class ID3v2Tag:
 
     @staticmethod
     def has_id3v2(data):
         return data.startswith(b'ID3')
 
-    def __init__(self, data):
+    def __init__(self, data, lazy=False):
         offset = 0
         self.header = ID3v2Header(data[offset:])
         offset += self.header.size
@@ -130,12 +143,132 @@ class ID3v2Tag:
                 self.total_frame_crc = struct.unpack_from('>I', content, offset)
                 offset += 4
 
-        self.frames = []
+        # only record where each frame lives; bodies are decoded on access
+        self._content = content
+        self.entries = []
+        self.index = {} # frame_id -> list of positions in self.entries
         while True:
             if offset >= len(content) or content[offset] == 0: # padding is filled w/ b'\0'
                 break
-            frame_header = ID3v2FrameHeader(content[offset:])
-            offset += frame_header.size
-            frame_data = FrameForIdentifier(frame_header.frame_id)(content[offset:offset+frame_header.data_size])
-            offset += frame_header.data_size
-            self.frames.append((frame_header, frame_data))
+            frame_id, data_size, flags = _frame_header_struct.unpack_from(content, offset)
+            offset += _frame_header_struct.size
+            self.index.setdefault(frame_id, []).append(len(self.entries))
+            self.entries.append(ID3v2FrameEntry(frame_id, offset, data_size, ID3v2FrameHeaderFlag(flags)))
+            offset += data_size
+        self._decoded = [None] * len(self.entries)
+        self._frames = None
+
+        if not lazy:
+            for i in range(len(self.entries)):
+                self.frame_at(i)
+
+    def frame_at(self, i):
+        '''frame data (w/o header) of the `i`-th frame, decoded on first access'''
+        frame_data = self._decoded[i]
+        if frame_data is None:
+            entry = self.entries[i]
+            frame_data = FrameForIdentifier(entry.frame_id)(self._content[entry.offset:entry.offset+entry.size])
+            self._decoded[i] = frame_data
+        return frame_data
+
+    @property
+    def frames(self):
+        '''list of (frame_header, frame_data), built once on first access'''
+        if self._frames is None:
+            frames = []
+            for i, entry in enumerate(self.entries):
+                frame_header = ID3v2FrameHeader(self._content[entry.offset-_frame_header_struct.size:entry.offset])
+                frames.append((frame_header, self.frame_at(i)))
+            self._frames = frames
+        return self._frames
+
+    def get_all(self, frame_id):
+        '''all frames (w/o header) whose identifier is `frame_id`, in tag order'''
+        return [self.frame_at(i) for i in self.index.get(encode_frame_id(frame_id), [])]
+
+    def get(self, frame_id, default=None):
+        '''first frame whose identifier is `frame_id`, or `default` if absent'''
+        positions = self.index.get(encode_frame_id(frame_id))
+        if not positions:
+            return default
+        return self.frame_at(positions[0])
+
+    def __contains__(self, frame_id):
+        return encode_frame_id(frame_id) in self.index
+
+    def __getitem__(self, frame_id):
+        frame = self.get(frame_id)
+        if frame is None:
+            raise KeyError(frame_id)
+        return frame
+
+
+class ID3v1Fields(BinaryBase):
+    identifier = Item('3s')
+    title = Item('30s')
+    artist = Item('30s')
+    album = Item('30s')
+    year = Item('4s')
+    comment = Item('30s')
+    genre = Item('B')
+
+
+def _id3v1_text(buf):
+    return str(buf.split(b'\0', 1)[0], encoding='latin-1').rstrip(' ')
+
+
+class ID3v1Tag:
+    size = 128
+
+    @staticmethod
+    def has_id3v1(data, end=None):
+        if end is None:
+            end = len(data)
+        return end >= ID3v1Tag.size and data[end-ID3v1Tag.size:end-ID3v1Tag.size+3] == b'TAG'
+
+    def __init__(self, data, end=None):
+        if end is None:
+            end = len(data)
+        self.offset = end - self.size
+        self.raw = data[self.offset:end]
+        self._fields = None
+
+    @property
+    def fields(self):
+        if self._fields is None:
+            self._fields = ID3v1Fields(self.raw)
+        return self._fields
+
+    @property
+    def title(self):
+        return _id3v1_text(self.fields.title)
+
+    @property
+    def artist(self):
+        return _id3v1_text(self.fields.artist)
+
+    @property
+    def album(self):
+        return _id3v1_text(self.fields.album)
+
+    @property
+    def year(self):
+        return _id3v1_text(self.fields.year)
+
+    @property
+    def comment(self):
+        comment = self.fields.comment
+        if self.track is not None: # ID3v1.1 stores track number in the last 2 bytes
+            comment = comment[:28]
+        return _id3v1_text(comment)
+
+    @property
+    def track(self):
+        comment = self.fields.comment
+        if comment[28] == 0 and comment[29] != 0:
+            return comment[29]
+        return None
+
+    @property
+    def genre(self):
+        return self.fields.genre
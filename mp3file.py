@@ -2,11 +2,12 @@ import struct
 
 from mp3frame import MP3FrameHeader
 from id3 import ID3v2Tag
+from trailer import Trailers
 
 
-def find_next_frame(buf, offset):
+def find_next_frame(buf, offset, end=None):
     pos = offset
-    bufsiz = len(buf)
+    bufsiz = len(buf) if end is None else end
     while pos < bufsiz - 1:
         if buf[pos] != 0xff:
             pos += 1
@@ -21,7 +22,9 @@ class MP3File:
         self.data = data
         offset = 0
         if ID3v2Tag.has_id3v2(data[offset:]):
-            self.id3v2 = ID3v2Tag(data)
+            self.id3v2 = ID3v2Tag(data, lazy=True)
             offset += self.id3v2.size
-        offset = find_next_frame(data, offset)
+        self.trailers = Trailers(data, offset)
+        self.audio_end = self.trailers.audio_end
+        offset = find_next_frame(data, offset, self.audio_end)
         
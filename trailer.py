@@ -0,0 +1,189 @@
+from enum import IntFlag
+import struct
+
+from binary import BinaryBase, Item, EnumTransformer
+from id3 import ID3v1Tag
+
+
+class APEv2Flag(IntFlag):
+    CONTAINS_HEADER = 1 << 31
+    CONTAINS_NO_FOOTER = 1 << 30
+    IS_HEADER = 1 << 29
+
+
+class APEv2Footer(BinaryBase):
+    '''header / footer of APEv2 tag (both share the same 32-byte layout)'''
+    identifier = Item('8s')
+    version = Item('<I')
+    tag_size = Item('<I') # items + footer, w/o header
+    item_count = Item('<I')
+    flags = Item('<I', EnumTransformer(APEv2Flag))
+    reserved = Item('8s')
+
+
+class APEv2Tag:
+    footer_size = 32
+
+    @staticmethod
+    def has_apev2(data, end):
+        return end >= APEv2Tag.footer_size and data[end-APEv2Tag.footer_size:end-APEv2Tag.footer_size+8] == b'APETAGEX'
+
+    def __init__(self, data, end):
+        self.data = data
+        self.footer = APEv2Footer(data[end-self.footer_size:end])
+        self.items_offset = end - self.footer.tag_size
+        self.offset = self.items_offset
+        if self.footer.flags & APEv2Flag.CONTAINS_HEADER:
+            self.offset -= self.footer_size
+        if self.footer.tag_size < self.footer_size or self.offset < 0:
+            raise ValueError('invalid APEv2 tag size')
+        self.size = end - self.offset
+        self._items = None
+
+    @classmethod
+    def try_parse(cls, data, end, start=0):
+        '''APEv2Tag ending at `end`, or None if absent / invalid / reaching before `start`'''
+        if not cls.has_apev2(data, end):
+            return None
+        try:
+            tag = cls(data, end)
+        except ValueError:
+            return None
+        if tag.offset < start:
+            return None
+        return tag
+
+    @property
+    def items(self):
+        '''dict of item key -> raw value, parsed on first access'''
+        if self._items is None:
+            buf = self.data[self.items_offset:self.items_offset+self.footer.tag_size-self.footer_size]
+            items = {}
+            offset = 0
+            # stop at the first malformed item, keeping the ones already read
+            for _ in range(self.footer.item_count):
+                if offset + 8 > len(buf):
+                    break
+                value_size, _flags = struct.unpack_from('<II', buf, offset)
+                idx = buf.find(b'\0', offset + 8)
+                if idx < 0 or idx + 1 + value_size > len(buf):
+                    break
+                key = str(buf[offset+8:idx], encoding='ascii', errors='replace')
+                offset = idx + 1
+                items[key] = buf[offset:offset+value_size]
+                offset += value_size
+            self._items = items
+        return self._items
+
+
+class Lyrics3Tag:
+    '''Lyrics3 v1 (LYRICSBEGIN ... LYRICSEND) or v2 (LYRICSBEGIN ... <size>LYRICS200)'''
+    max_v1_lyrics_size = 5100
+
+    @staticmethod
+    def has_lyrics3(data, end):
+        return end >= 9 and data[end-9:end] in (b'LYRICSEND', b'LYRICS200')
+
+    def __init__(self, data, end):
+        self.data = data
+        marker = data[end-9:end]
+        if marker == b'LYRICS200':
+            self.version = 2
+            size_field = data[end-15:end-9]
+            if len(size_field) != 6 or not size_field.isdigit():
+                raise ValueError('invalid Lyrics3v2 tag size')
+            size = int(size_field)
+            self.offset = end - 15 - size
+            if self.offset < 0 or data[self.offset:self.offset+11] != b'LYRICSBEGIN':
+                raise ValueError('invalid Lyrics3v2 tag')
+            self.content_offset = self.offset + 11
+            self.content_end = end - 15
+        else:
+            self.version = 1
+            window_start = max(0, end - 9 - self.max_v1_lyrics_size - 11)
+            idx = data[window_start:end-9].rfind(b'LYRICSBEGIN')
+            if idx < 0:
+                raise ValueError('invalid Lyrics3v1 tag')
+            self.offset = window_start + idx
+            self.content_offset = self.offset + 11
+            self.content_end = end - 9
+        self.size = end - self.offset
+        self._fields = None
+
+    @classmethod
+    def try_parse(cls, data, end, start=0):
+        '''Lyrics3Tag ending at `end`, or None if absent / invalid / reaching before `start`'''
+        if not cls.has_lyrics3(data, end):
+            return None
+        try:
+            tag = cls(data, end)
+        except ValueError:
+            return None
+        if tag.offset < start:
+            return None
+        return tag
+
+    @property
+    def fields(self):
+        '''dict of field id -> raw value, parsed on first access
+
+        Lyrics3v1 has only lyrics, which is exposed as `LYR` field.
+        '''
+        if self._fields is None:
+            buf = self.data[self.content_offset:self.content_end]
+            fields = {}
+            if self.version == 1:
+                fields['LYR'] = buf
+            else:
+                # stop at the first malformed field, keeping the ones already read
+                offset = 0
+                while offset + 8 <= len(buf):
+                    size_field = buf[offset+3:offset+8]
+                    if not size_field.isdigit():
+                        break
+                    field_id = str(buf[offset:offset+3], encoding='latin-1')
+                    field_size = int(size_field)
+                    offset += 8
+                    if offset + field_size > len(buf):
+                        break
+                    fields[field_id] = buf[offset:offset+field_size]
+                    offset += field_size
+            self._fields = fields
+        return self._fields
+
+
+class Trailers:
+    '''tags appended after the audio data (ID3v1, APEv2, Lyrics3)
+
+    Only the tail of `data` is examined, so `data` can be bytes or mmap.
+    Detection is best-effort: an invalid or truncated tag is not stripped,
+    and no tag may reach before `start` (e.g. the end of a leading ID3v2 tag).
+    `audio_end` is the offset where the audio frames end.
+    '''
+
+    def __init__(self, data, start=0, end=None):
+        if end is None:
+            end = len(data)
+        self.id3v1 = None
+        self.apev2 = None
+        self.lyrics3 = None
+
+        if ID3v1Tag.has_id3v1(data, end) and end - ID3v1Tag.size >= start:
+            self.id3v1 = ID3v1Tag(data, end)
+            end = self.id3v1.offset
+
+        # APEv2 and Lyrics3 may appear in either order
+        while True:
+            if self.apev2 is None:
+                self.apev2 = APEv2Tag.try_parse(data, end, start)
+                if self.apev2 is not None:
+                    end = self.apev2.offset
+                    continue
+            if self.lyrics3 is None:
+                self.lyrics3 = Lyrics3Tag.try_parse(data, end, start)
+                if self.lyrics3 is not None:
+                    end = self.lyrics3.offset
+                    continue
+            break
+
+        self.audio_end = end